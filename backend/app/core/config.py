@@ -34,6 +34,7 @@ class Settings(BaseSettings):
     debabelizer_tts_provider: str
     debabelizer_optimize_for: str
     elevenlabs_output_format: str
+    max_concurrent_stt_sessions: int = 64
     
     # Authentication Settings
     app_url: str = "https://debabelize.me"
@@ -0,0 +1,32 @@
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging():
+    """Route root logger output through a queue so handler I/O runs off the event loop"""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+def shutdown_logging():
+    """Flush and stop the background log listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
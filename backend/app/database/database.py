@@ -94,6 +94,15 @@ class Database:
                 ON user_usage_stats (user_id, date)
             """)
             
+            # Date-range scans across all users (recent activity reports)
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_usage_stats_date 
+                ON user_usage_stats (date)
+            """)
+            
+            # WAL lets reporting scripts read while the backend writes
+            await db.execute("PRAGMA journal_mode=WAL")
+            
             await db.commit()
             logger.info("Database initialized successfully")
     
@@ -403,4 +412,87 @@ class Database:
                 return [dict(row) for row in rows]
         except Exception as e:
             logger.error(f"Error getting usage summary: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    @classmethod
+    async def get_global_usage_totals(cls) -> Dict[str, int]:
+        """Get usage totals summed across all active users"""
+        try:
+            async with aiosqlite.connect(DB_PATH) as db:
+                db.row_factory = aiosqlite.Row
+                cursor = await db.execute("""
+                    SELECT 
+                        COALESCE(SUM(us.stt_words), 0) as total_stt_words,
+                        COALESCE(SUM(us.tts_words), 0) as total_tts_words,
+                        COALESCE(SUM(us.stt_requests), 0) as total_stt_requests,
+                        COALESCE(SUM(us.tts_requests), 0) as total_tts_requests
+                    FROM user_usage_stats us
+                    JOIN users u ON u.id = us.user_id
+                    WHERE u.is_active = TRUE
+                """)
+                row = await cursor.fetchone()
+                return dict(row)
+        except Exception as e:
+            logger.error(f"Error getting global usage totals: {e}")
+            return {
+                "total_stt_words": 0,
+                "total_tts_words": 0,
+                "total_stt_requests": 0,
+                "total_tts_requests": 0
+            }
+    
+    @classmethod
+    async def get_user_usage_summary_by_email(cls, email: str) -> Optional[Dict[str, Any]]:
+        """Get usage summary for a single user by email address"""
+        try:
+            async with aiosqlite.connect(DB_PATH) as db:
+                db.row_factory = aiosqlite.Row
+                # Emails are stored lowercased, so the UNIQUE index on email serves this lookup
+                cursor = await db.execute("""
+                    SELECT 
+                        u.id as user_id,
+                        u.email,
+                        u.created_at as user_created,
+                        COALESCE(SUM(us.stt_words), 0) as total_stt_words,
+                        COALESCE(SUM(us.tts_words), 0) as total_tts_words,
+                        COALESCE(SUM(us.stt_requests), 0) as total_stt_requests,
+                        COALESCE(SUM(us.tts_requests), 0) as total_tts_requests,
+                        COUNT(DISTINCT us.date) as active_days,
+                        MIN(us.date) as first_usage,
+                        MAX(us.date) as last_usage
+                    FROM users u
+                    LEFT JOIN user_usage_stats us ON u.id = us.user_id
+                    WHERE u.email = ? AND u.is_active = TRUE
+                    GROUP BY u.id, u.email
+                """, (email.lower(),))
+                row = await cursor.fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Error getting usage summary for {email}: {e}")
+            return None
+    
+    @classmethod
+    async def get_recent_activity_for_all_users(cls, start_date: str) -> list:
+        """Get per-user word totals since start_date for users with any activity"""
+        try:
+            async with aiosqlite.connect(DB_PATH) as db:
+                db.row_factory = aiosqlite.Row
+                cursor = await db.execute("""
+                    SELECT 
+                        u.id as user_id,
+                        u.email,
+                        SUM(us.stt_words) as stt_words,
+                        SUM(us.tts_words) as tts_words,
+                        SUM(us.stt_words) + SUM(us.tts_words) as total_words
+                    FROM user_usage_stats us
+                    JOIN users u ON u.id = us.user_id
+                    WHERE us.date >= ? AND u.is_active = TRUE
+                    GROUP BY u.id, u.email
+                    HAVING total_words > 0
+                    ORDER BY total_words DESC
+                """, (start_date,))
+                rows = await cursor.fetchall()
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting recent activity since {start_date}: {e}")
+            return []
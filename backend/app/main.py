@@ -3,11 +3,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 import io
 from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.models.schemas import (
     ChatMessage, ChatResponse, TTSRequest, STTResponse, ClearConversationRequest
 )
 from app.services.voice_service import voice_service
-from app.services.chat_service import chat_service
+from app.services.chat_service import chat_service, openai_client
 from app.services.session_service import session_service
 from app.utils.audio_processing import AUDIO_BUFFER_CONFIG
 from app.websockets.stt_handler import handle_stt_websocket
@@ -40,6 +41,9 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Initialize voice processors and database on startup"""
+    # Move log handler I/O onto a background thread
+    setup_logging()
+    
     # Initialize database
     await Database.initialize()
     
@@ -197,9 +201,14 @@ async def debug_stt():
 async def shutdown_event():
     """Clean up resources on shutdown"""
     print("Shutting down - cleaning up resources...")
+    await openai_client.close()
     # Voice service cleanup happens automatically
     print("Shutdown cleanup complete")
+    shutdown_logging()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8005)
\ No newline at end of file
+    uvicorn.run(
+        app, host="0.0.0.0", port=8005, loop="uvloop", http="httptools",
+        ws_ping_interval=20, ws_ping_timeout=40
+    )
\ No newline at end of file
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 from datetime import datetime
+from app.core.config import settings
 
 class ChatMessage(BaseModel):
     message: str
@@ -13,10 +14,24 @@ class ChatResponse(BaseModel):
     response_language: Optional[str] = None
     session_id: str
 
+# Per-provider input caps; providers not listed here enforce their own limits
+TTS_TEXT_LENGTH_LIMITS = {
+    'openai': 4096,
+}
+
 class TTSRequest(BaseModel):
-    text: str
+    # Rejected during validation, before usage is tracked or a provider is called
+    text: str = Field(..., min_length=1)
     language: Optional[str] = None
     voice: Optional[str] = None
+    
+    @field_validator('text')
+    @classmethod
+    def check_provider_length(cls, text: str) -> str:
+        limit = TTS_TEXT_LENGTH_LIMITS.get(settings.debabelizer_tts_provider)
+        if limit is not None and len(text) > limit:
+            raise ValueError(f"Text too long for {settings.debabelizer_tts_provider} TTS ({len(text)} > {limit} characters)")
+        return text
 
 class STTResponse(BaseModel):
     text: str
@@ -3,10 +3,12 @@ import secrets
 import sendgrid
 from sendgrid.helpers.mail import Mail, From, To, Subject, HtmlContent, PlainTextContent
 from sendgrid import SendGridAPIClient
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 import logging
 import os
+import time
 from app.database.database import Database
 from app.models.auth import UserResponse
 from app.core.config import settings
@@ -34,6 +36,11 @@ class AuthService:
         # Session configuration
         self.session_duration_days = settings.session_duration_days
         self.confirmation_token_hours = settings.confirmation_token_hours
+        
+        # In-process cache of validated sessions (token -> (expires_at, user))
+        self.session_cache_ttl_seconds = 60
+        self.session_cache_max_size = 10000
+        self._session_cache: "OrderedDict[str, Tuple[float, UserResponse]]" = OrderedDict()
     
     @staticmethod
     def hash_password(password: str) -> str:
@@ -314,8 +321,31 @@ The Debabelizer Team
             logger.error(f"Error validating session: {e}")
             return None
     
+    async def validate_session_cached(self, session_token: str) -> Optional[UserResponse]:
+        """Validate session token, reusing a recent validation when available"""
+        now = time.monotonic()
+        cached = self._session_cache.get(session_token)
+        if cached:
+            expires_at, user = cached
+            if expires_at > now:
+                self._session_cache.move_to_end(session_token)
+                return user
+            del self._session_cache[session_token]
+        
+        user = await self.validate_session(session_token)
+        if user:
+            self._session_cache[session_token] = (now + self.session_cache_ttl_seconds, user)
+            if len(self._session_cache) > self.session_cache_max_size:
+                self._session_cache.popitem(last=False)
+        return user
+    
+    def invalidate_cached_session(self, session_token: str):
+        """Drop a session token from the validation cache"""
+        self._session_cache.pop(session_token, None)
+    
     async def logout_user(self, session_token: str) -> bool:
         """Logout user by deleting session"""
+        self.invalidate_cached_session(session_token)
         try:
             return await Database.delete_user_session(session_token)
         except Exception as e:
@@ -1,4 +1,4 @@
-import openai
+from openai import AsyncOpenAI
 import json
 from typing import Optional
 from app.core.config import settings
@@ -9,8 +9,8 @@ from app.services.security_service import security_service
 from app.models.schemas import ChatMessage, ChatResponse
 from app.core.agent_config import get_telephony_agent_prompt
 
-# Initialize OpenAI
-openai.api_key = settings.openai_api_key
+# Shared async client; its connection pool keeps HTTPS connections alive across requests
+openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
 
 class ChatService:
     def __init__(self):
@@ -35,7 +35,7 @@ class ChatService:
     async def _detect_language(self, text: str) -> str:
         """Detect the language of the input text using GPT"""
         try:
-            response = openai.chat.completions.create(
+            response = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -122,7 +122,7 @@ class ChatService:
         ]
         
         # Stream response from GPT with function calling
-        response = openai.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=messages,
             max_tokens=1000,
@@ -158,7 +158,7 @@ class ChatService:
                 {"role": "system", "content": system_prompt},
                 *conversation_history[1:]  # Skip the old system message if any
             ]
-            final_response = openai.chat.completions.create(
+            final_response = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=final_messages,
                 max_tokens=1000,
@@ -234,7 +234,7 @@ class ChatService:
         ]
         
         # First try with function calling (non-streaming to handle tools)
-        initial_response = openai.chat.completions.create(
+        initial_response = await openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=messages,
             max_tokens=1000,
@@ -277,7 +277,7 @@ class ChatService:
                 {"role": "system", "content": system_prompt},
                 *conversation_history[1:]  # Skip the old system message if any
             ]
-            final_response = openai.chat.completions.create(
+            final_response = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=final_messages,
                 max_tokens=1000,
@@ -285,13 +285,13 @@ class ChatService:
                 stream=True
             )
             
-            full_response = ""
-            for chunk in final_response:
+            response_parts = []
+            async for chunk in final_response:
                 if chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
                     # Filter sensitive information in real-time
                     filtered_content = security_service.filter_sensitive_output(content)
-                    full_response += filtered_content
+                    response_parts.append(filtered_content)
                     await websocket.send_json({
                         "type": "content",
                         "content": filtered_content,
@@ -299,7 +299,7 @@ class ChatService:
                     })
         else:
             # No function calls, stream normally
-            stream_response = openai.chat.completions.create(
+            stream_response = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 max_tokens=1000,
@@ -307,19 +307,22 @@ class ChatService:
                 stream=True
             )
             
-            full_response = ""
-            for chunk in stream_response:
+            response_parts = []
+            async for chunk in stream_response:
                 if chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
                     # Filter sensitive information in real-time
                     filtered_content = security_service.filter_sensitive_output(content)
-                    full_response += filtered_content
+                    response_parts.append(filtered_content)
                     await websocket.send_json({
                         "type": "content",
                         "content": filtered_content,
                         "session_id": session_id
                     })
         
+        # Join the streamed parts once instead of growing a string per token
+        full_response = "".join(response_parts)
+        
         # Add AI response to history
         conversation_history.append({"role": "assistant", "content": full_response})
         
@@ -2,6 +2,30 @@ from debabelizer import VoiceProcessor, DebabelizerConfig
 from app.core.config import settings
 import traceback
 
+# Settings attributes each provider needs before a processor can be created
+_STT_CREDENTIAL_REQUIREMENTS = {
+    'deepgram': ('deepgram_api_key',),
+    'openai': ('openai_api_key',),
+    'azure': ('azure_speech_key',),
+    'soniox': ('soniox_api_key',),
+    'whisper': (),  # Whisper doesn't need API key
+    'google': ('google_application_credentials',),
+}
+
+_TTS_CREDENTIAL_REQUIREMENTS = {
+    'elevenlabs': ('elevenlabs_api_key',),
+    'openai': ('openai_api_key',),
+    'azure': ('azure_speech_key',),
+    'google': ('google_application_credentials',),
+}
+
+def _has_credentials(requirements: dict, provider: str) -> bool:
+    """Check that every settings attribute required by the provider is set"""
+    required = requirements.get(provider)
+    if required is None:
+        return False
+    return all(getattr(settings, attr, None) for attr in required)
+
 class VoiceService:
     def __init__(self):
         self.stt_processor = None
@@ -94,25 +118,11 @@ class VoiceService:
     
     def _has_stt_credentials(self):
         """Check if STT provider has required credentials"""
-        provider = settings.debabelizer_stt_provider
-        return (
-            (provider == 'deepgram' and settings.deepgram_api_key) or
-            (provider == 'openai' and settings.openai_api_key) or
-            (provider == 'azure' and settings.azure_speech_key) or
-            (provider == 'soniox' and settings.soniox_api_key) or
-            (provider == 'whisper') or  # Whisper doesn't need API key
-            (provider == 'google' and settings.google_application_credentials)
-        )
+        return _has_credentials(_STT_CREDENTIAL_REQUIREMENTS, settings.debabelizer_stt_provider)
     
     def _has_tts_credentials(self):
         """Check if TTS provider has required credentials"""
-        provider = settings.debabelizer_tts_provider
-        return (
-            (provider == 'elevenlabs' and settings.elevenlabs_api_key) or
-            (provider == 'openai' and settings.openai_api_key) or
-            (provider == 'azure' and settings.azure_speech_key) or
-            (provider == 'google' and settings.google_application_credentials)
-        )
+        return _has_credentials(_TTS_CREDENTIAL_REQUIREMENTS, settings.debabelizer_tts_provider)
     
     def get_default_voice(self):
         """Get appropriate default voice based on provider"""
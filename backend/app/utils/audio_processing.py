@@ -1,3 +1,6 @@
+import numpy as np
+from typing import Tuple
+
 # Audio buffering configuration for fake streaming approach - balanced latency vs reliability
 AUDIO_BUFFER_CONFIG = {
     "min_buffer_size": 12000,      # ~0.75 second at 16kHz PCM - balanced for reliability
@@ -7,6 +10,29 @@ AUDIO_BUFFER_CONFIG = {
     "channels": 1                  # Mono audio
 }
 
+# Peak int16 amplitude below which a buffer is treated as silence
+SILENCE_AMPLITUDE_THRESHOLD = 50
+
+# Thresholds read on every frame, bound once at import
+_MIN_BUFFER_SIZE = AUDIO_BUFFER_CONFIG["min_buffer_size"]
+_MAX_BUFFER_SIZE = AUDIO_BUFFER_CONFIG["max_buffer_size"]
+_SILENCE_TIMEOUT = AUDIO_BUFFER_CONFIG["silence_timeout"]
+
+def pcm16_amplitude_stats(samples: np.ndarray) -> Tuple[int, float, int]:
+    """Return (peak, mean absolute amplitude, non-zero count) for int16 PCM samples"""
+    if samples.size == 0:
+        return 0, 0.0, 0
+    # Widen before abs so -32768 doesn't wrap
+    magnitudes = np.abs(samples, dtype=np.int32)
+    return int(magnitudes.max()), float(magnitudes.mean()), int(np.count_nonzero(samples))
+
+def is_silent_pcm16(samples: np.ndarray, threshold: int = SILENCE_AMPLITUDE_THRESHOLD) -> bool:
+    """Check whether int16 PCM samples never exceed the silence threshold"""
+    if samples.size == 0:
+        return True
+    # Compare the extremes instead of taking abs of every sample
+    return int(samples.max()) < threshold and int(samples.min()) > -threshold
+
 class AudioBufferManager:
     def __init__(self):
         self.buffering_sessions = {}
@@ -14,7 +40,9 @@ class AudioBufferManager:
     def create_session(self, session_id: str):
         """Create a new audio buffering session"""
         self.buffering_sessions[session_id] = {
-            "audio_buffer": bytearray(),
+            # Preallocated backing store reused across flushes; write_pos marks the filled prefix
+            "audio_buffer": bytearray(_MAX_BUFFER_SIZE),
+            "write_pos": 0,
             "last_audio_time": None,
             "last_process_time": None
         }
@@ -25,7 +53,11 @@ class AudioBufferManager:
             return False
         
         session = self.buffering_sessions[session_id]
-        session["audio_buffer"].extend(data)
+        write_pos = session["write_pos"]
+        end_pos = write_pos + len(data)
+        # Slice assignment writes in place and only grows the buffer past its capacity
+        session["audio_buffer"][write_pos:end_pos] = data
+        session["write_pos"] = end_pos
         session["last_audio_time"] = current_time
         return True
     
@@ -35,7 +67,7 @@ class AudioBufferManager:
             return False
         
         session = self.buffering_sessions[session_id]
-        buffer_size = len(session["audio_buffer"])
+        buffer_size = session["write_pos"]
         
         time_since_last_process = (
             current_time - session["last_process_time"] 
@@ -44,9 +76,9 @@ class AudioBufferManager:
         
         # Process with balanced approach for reliability and latency
         should_process = (
-            buffer_size >= AUDIO_BUFFER_CONFIG["max_buffer_size"] or  # Prevent memory overflow
-            (buffer_size >= AUDIO_BUFFER_CONFIG["min_buffer_size"] and 
-             time_since_last_process >= AUDIO_BUFFER_CONFIG["silence_timeout"])  # Use configured timeout
+            buffer_size >= _MAX_BUFFER_SIZE or  # Prevent memory overflow
+            (buffer_size >= _MIN_BUFFER_SIZE and 
+             time_since_last_process >= _SILENCE_TIMEOUT)  # Use configured timeout
         )
         
         return should_process and buffer_size > 0
@@ -57,10 +89,10 @@ class AudioBufferManager:
             return b''
         
         session = self.buffering_sessions[session_id]
-        buffered_audio = bytes(session["audio_buffer"])
+        buffered_audio = bytes(memoryview(session["audio_buffer"])[:session["write_pos"]])
         
-        # Clear the buffer and update process time
-        session["audio_buffer"] = bytearray()
+        # Rewind the buffer (keeping its allocation) and update process time
+        session["write_pos"] = 0
         session["last_process_time"] = current_time
         
         return buffered_audio
@@ -71,7 +103,7 @@ class AudioBufferManager:
             return b''
         
         session = self.buffering_sessions[session_id]
-        return bytes(session["audio_buffer"])
+        return bytes(memoryview(session["audio_buffer"])[:session["write_pos"]])
     
     def cleanup_session(self, session_id: str):
         """Clean up buffering session"""
@@ -0,0 +1,11 @@
+import orjson
+from fastapi import WebSocket
+
+async def send_json_fast(websocket: WebSocket, data: dict):
+    """
+    Send a JSON message over a WebSocket using orjson.
+    
+    Frames are sent as text, matching websocket.send_json, so clients
+    can keep calling JSON.parse on event.data.
+    """
+    await websocket.send_text(orjson.dumps(data).decode())
@@ -1,21 +1,28 @@
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
-import traceback
+import logging
 from app.services.voice_service import voice_service
 from app.utils.audio_processing import AUDIO_BUFFER_CONFIG
 from app.database.database import Database
 from app.utils.word_counter import count_words
+from app.utils.json_utils import send_json_fast
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Close sessions that send nothing, so idle sockets can't hold a session slot
+IDLE_TIMEOUT_SECONDS = 60
+
 async def handle_deepgram_streaming(websocket: WebSocket, current_user: Optional[object] = None):
     """WebSocket handler for Deepgram using true WebSocket streaming."""
     await websocket.accept()
     session_id = None
     streaming_task = None
+    idle_task = None
     
     try:
         if not voice_service.stt_processor:
-            await websocket.send_json({"error": "STT processor not initialized"})
+            await send_json_fast(websocket, {"error": "STT processor not initialized"})
             return
         
         # Start streaming session
@@ -30,24 +37,39 @@ async def handle_deepgram_streaming(websocket: WebSocket, current_user: Optional
             utterance_end_ms=1500
         )
         
-        print(f"Started Deepgram true streaming session: {session_id}")
+        logger.info("Started Deepgram true streaming session: %s", session_id)
         
         # Start a task to handle streaming results
         async def process_streaming_results():
+            # Reused for every result; send_json_fast serializes before yielding
+            response_data = {
+                "text": "",
+                "is_final": False,
+                "confidence": 0.0,
+                "provider": "deepgram",
+                "streaming": True,  # Indicate true streaming
+                "session_id": session_id
+            }
+            last_sent = None
             try:
                 async for result in voice_service.stt_processor.get_streaming_results(session_id):
                     # Handle VAD events (indicated by special text markers)
                     if result.text == "[SPEECH_STARTED]":
-                        print("Speech started detected")
+                        logger.debug("Speech started detected")
                         # Could send a signal to frontend if needed
                         continue
                     elif result.text == "[UTTERANCE_END]":
-                        print("Utterance end detected")
+                        logger.debug("Utterance end detected")
                         # Could send utterance end signal
                         continue
                     
                     # Handle transcription results
                     if result.text or result.is_final:
+                        # Skip interim results identical to the previous (text, is_final) pair; finals always go through
+                        if not result.is_final and (result.text, result.is_final) == last_sent:
+                            continue
+                        last_sent = (result.text, result.is_final)
+                        
                         # Track words for final results only (to avoid double counting)
                         if result.is_final and result.text and current_user:
                             word_count = count_words(result.text)
@@ -56,32 +78,47 @@ async def handle_deepgram_streaming(websocket: WebSocket, current_user: Optional
                                     user_id=current_user.id,
                                     stt_words=word_count
                                 )
-                                print(f"Tracked {word_count} STT words for user {current_user.email}")
+                                logger.debug("Tracked %d STT words for user %s", word_count, current_user.email)
                         
-                        response_data = {
-                            "text": result.text,
-                            "is_final": result.is_final,
-                            "confidence": result.confidence,
-                            "provider": "deepgram",
-                            "streaming": True,  # Indicate true streaming
-                            "session_id": result.session_id
-                        }
+                        response_data["text"] = result.text
+                        response_data["is_final"] = result.is_final
+                        response_data["confidence"] = result.confidence
+                        response_data["session_id"] = result.session_id
                         
                         # Debug: Sending result (removed to reduce log noise)
-                        await websocket.send_json(response_data)
+                        await send_json_fast(websocket, response_data)
                         
             except Exception as e:
-                print(f"Error in streaming results processor: {e}")
-                traceback.print_exc()
+                logger.exception("Error in streaming results processor: %s", e)
         
         # Start the results processor
         streaming_task = asyncio.create_task(process_streaming_results())
         
+        # Idle deadline: one timer per session instead of a timeout on every receive.
+        # Any frame counts, including the frontend's empty keepalives.
+        loop = asyncio.get_running_loop()
+        last_receive_time = loop.time()
+        
+        async def idle_watchdog():
+            """Close the socket once no frame has arrived for IDLE_TIMEOUT_SECONDS"""
+            remaining = IDLE_TIMEOUT_SECONDS
+            while remaining > 0:
+                await asyncio.sleep(remaining)
+                remaining = last_receive_time + IDLE_TIMEOUT_SECONDS - loop.time()
+            logger.info("WebSocket timeout - no data received for %ds, session %s", IDLE_TIMEOUT_SECONDS, session_id)
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+        
+        idle_task = asyncio.create_task(idle_watchdog())
+        
         # Handle incoming audio
         while True:
             try:
-                # Receive audio data with timeout
-                data = await asyncio.wait_for(websocket.receive_bytes(), timeout=60.0)
+                # Receive audio data (the idle watchdog closes the socket if frames stop)
+                data = await websocket.receive_bytes()
+                last_receive_time = loop.time()
                 
                 if len(data) == 0:
                     # Keepalive ping
@@ -90,25 +127,24 @@ async def handle_deepgram_streaming(websocket: WebSocket, current_user: Optional
                 # Stream audio directly to Deepgram
                 await voice_service.stt_processor.stream_audio(session_id, data)
                 
-            except asyncio.TimeoutError:
-                print(f"WebSocket timeout - no data received for 60s, session {session_id}")
-                break
             except WebSocketDisconnect:
-                print(f"WebSocket disconnected for session {session_id}")
+                logger.info("WebSocket disconnected for session %s", session_id)
                 break
             except Exception as loop_error:
-                print(f"Error in Deepgram streaming audio loop: {loop_error}")
-                traceback.print_exc()
+                logger.exception("Error in Deepgram streaming audio loop: %s", loop_error)
                 break
         
     except Exception as e:
-        print(f"Deepgram streaming WebSocket error: {e}")
-        traceback.print_exc()
+        logger.exception("Deepgram streaming WebSocket error: %s", e)
         try:
-            await websocket.send_json({"error": str(e)})
+            await send_json_fast(websocket, {"error": str(e)})
         except:
             pass
     finally:
+        # Stop the idle watchdog
+        if idle_task:
+            idle_task.cancel()
+        
         # Cancel streaming task
         if streaming_task and not streaming_task.done():
             streaming_task.cancel()
@@ -121,9 +157,9 @@ async def handle_deepgram_streaming(websocket: WebSocket, current_user: Optional
         if session_id:
             try:
                 await voice_service.stt_processor.stop_streaming_transcription(session_id)
-                print(f"Stopped Deepgram streaming session: {session_id}")
+                logger.info("Stopped Deepgram streaming session: %s", session_id)
             except Exception as cleanup_error:
-                print(f"Error stopping Deepgram streaming session: {cleanup_error}")
+                logger.error("Error stopping Deepgram streaming session: %s", cleanup_error)
         
         try:
             await websocket.close()
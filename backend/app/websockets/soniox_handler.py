@@ -1,53 +1,92 @@
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
 import uuid
-import traceback
+import logging
 from app.services.voice_service import voice_service
 from app.database.database import Database
 from app.utils.word_counter import count_words
+from app.utils.json_utils import send_json_fast
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Close sessions that send nothing, so idle sockets can't hold a session slot
+IDLE_TIMEOUT_SECONDS = 60
+
+def _build_result_accessors(result):
+    """Pick attribute accessors once from the first result's schema"""
+    if hasattr(result, 'language_detected'):
+        get_language = lambda r: r.language_detected
+    elif hasattr(result, 'language'):
+        get_language = lambda r: r.language
+    else:
+        get_language = lambda r: 'auto'
+    
+    if hasattr(result, 'confidence'):
+        get_confidence = lambda r: r.confidence
+    else:
+        get_confidence = lambda r: 0.0
+    
+    if hasattr(result, 'timestamp'):
+        get_timestamp = lambda r: r.timestamp.isoformat()
+    else:
+        get_timestamp = lambda r: None
+    
+    return get_language, get_confidence, get_timestamp
+
 async def handle_soniox_streaming(websocket: WebSocket, current_user: Optional[object] = None):
     """WebSocket handler for Soniox using real streaming (native streaming support)."""
     await websocket.accept()
     session_id = str(uuid.uuid4())
     stt_session_id = None
+    idle_task = None
     
     try:
         if not voice_service.stt_processor:
-            print("ERROR: STT processor not initialized")
-            await websocket.send_json({"error": "STT processor not initialized"})
+            logger.error("STT processor not initialized")
+            await send_json_fast(websocket, {"error": "STT processor not initialized"})
             await websocket.close()
             return
         
-        print(f"Started Soniox real streaming STT session: {session_id}")
-        print(f"Processor type: {type(voice_service.stt_processor)}")
+        logger.info("Started Soniox real streaming STT session: %s", session_id)
+        logger.debug("Processor type: %s", type(voice_service.stt_processor))
         
         # Start Soniox streaming session using correct method name
         try:
-            print("Attempting to start Soniox streaming...")
+            logger.debug("Attempting to start Soniox streaming...")
             stt_session_id = await voice_service.stt_processor.start_streaming_transcription(
                 audio_format="pcm",      # PCM format from frontend
                 sample_rate=16000,       # 16kHz from frontend  
                 enable_language_identification=True,  # Enable auto language detection
                 has_pending_audio=True   # Indicate we expect more audio
             )
-            print(f"SUCCESS: Soniox streaming session started: {stt_session_id}")
+            logger.info("Soniox streaming session started: %s", stt_session_id)
         except Exception as e:
-            print(f"CRITICAL ERROR: Failed to start Soniox streaming session: {e}")
-            print(f"Error type: {type(e)}")
-            import traceback
-            traceback.print_exc()
-            await websocket.send_json({"error": f"Failed to start streaming: {str(e)}"})
+            logger.exception("Failed to start Soniox streaming session (%s): %s", type(e).__name__, e)
+            await send_json_fast(websocket, {"error": f"Failed to start streaming: {str(e)}"})
             await websocket.close()
             return
         
         # Create task to handle streaming results
         async def handle_streaming_results():
             try:
-                print(f"Starting to listen for streaming results from session {stt_session_id}")
+                logger.debug("Starting to listen for streaming results from session %s", stt_session_id)
+                get_language = None
+                # Reused for every result; send_json_fast serializes before yielding
+                response_data = {
+                    "text": "",
+                    "is_final": False,
+                    "language": "auto",
+                    "confidence": 0.0,
+                    "provider": "soniox",
+                    "is_word": False,
+                    "timestamp": None
+                }
+                last_sent = None
                 async for result in voice_service.stt_processor.get_streaming_results(stt_session_id):
                     # Debug: Soniox result (removed to reduce log noise)
+                    if get_language is None:
+                        get_language, get_confidence, get_timestamp = _build_result_accessors(result)
                     
                     # Track words for final results only (to avoid double counting)
                     if result.is_final and result.text and current_user:
@@ -57,38 +96,57 @@ async def handle_soniox_streaming(websocket: WebSocket, current_user: Optional[o
                                 user_id=current_user.id,
                                 stt_words=word_count
                             )
-                            print(f"Tracked {word_count} STT words for user {current_user.email}")
-                    
-                    # Send result to frontend
-                    response_data = {
-                        "text": result.text,
-                        "is_final": result.is_final,
-                        "language": getattr(result, 'language_detected', getattr(result, 'language', 'auto')),
-                        "confidence": getattr(result, 'confidence', 0.0),
-                        "provider": "soniox",
-                        "is_word": len(result.text.split()) == 1,  # Flag for single words
-                        "timestamp": result.timestamp.isoformat() if hasattr(result, 'timestamp') else None
-                    }
+                            logger.debug("Tracked %d STT words for user %s", word_count, current_user.email)
                     
                     # Send both interim and final results (word-level streaming)
                     if result.text.strip():
+                        # Skip interim results identical to the previous (text, is_final) pair; finals always go through
+                        if not result.is_final and (result.text, result.is_final) == last_sent:
+                            continue
+                        last_sent = (result.text, result.is_final)
+                        
+                        response_data["text"] = result.text
+                        response_data["is_final"] = result.is_final
+                        response_data["language"] = get_language(result)
+                        response_data["confidence"] = get_confidence(result)
+                        response_data["is_word"] = len(result.text.split()) == 1  # Flag for single words
+                        response_data["timestamp"] = get_timestamp(result)
+                        
                         # Debug: Sending response (removed to reduce log noise)
-                        await websocket.send_json(response_data)
+                        await send_json_fast(websocket, response_data)
                         
-                print(f"Streaming results loop ended for session {stt_session_id}")
+                logger.debug("Streaming results loop ended for session %s", stt_session_id)
             except Exception as e:
-                print(f"CRITICAL: Error handling Soniox streaming results: {e}")
-                print(f"Error type: {type(e)}")
-                traceback.print_exc()
+                logger.exception("Error handling Soniox streaming results (%s): %s", type(e).__name__, e)
         
         # Start the results handler task
         results_task = asyncio.create_task(handle_streaming_results())
         
+        # Idle deadline: one timer per session instead of a timeout on every receive.
+        # Any frame counts, including the frontend's empty keepalives.
+        loop = asyncio.get_running_loop()
+        last_receive_time = loop.time()
+        
+        async def idle_watchdog():
+            """Close the socket once no frame has arrived for IDLE_TIMEOUT_SECONDS"""
+            remaining = IDLE_TIMEOUT_SECONDS
+            while remaining > 0:
+                await asyncio.sleep(remaining)
+                remaining = last_receive_time + IDLE_TIMEOUT_SECONDS - loop.time()
+            logger.info("Soniox WebSocket timeout - no data received for %ds, session %s", IDLE_TIMEOUT_SECONDS, session_id)
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+        
+        idle_task = asyncio.create_task(idle_watchdog())
+        
         # Handle incoming audio data
         while True:
             try:
-                # Receive audio data from frontend
-                data = await asyncio.wait_for(websocket.receive_bytes(), timeout=60.0)
+                # Receive audio data from frontend (the idle watchdog closes the socket if frames stop)
+                data = await websocket.receive_bytes()
+                last_receive_time = loop.time()
                 
                 if len(data) == 0:
                     # Keepalive ping - continue silently
@@ -100,19 +158,14 @@ async def handle_soniox_streaming(websocket: WebSocket, current_user: Optional[o
                 try:
                     await voice_service.stt_processor.stream_audio(stt_session_id, data)
                 except Exception as stream_error:
-                    print(f"Error streaming audio chunk to Soniox: {stream_error}")
-                    traceback.print_exc()
+                    logger.exception("Error streaming audio chunk to Soniox: %s", stream_error)
                     # Continue processing - don't break on individual chunk errors
                 
-            except asyncio.TimeoutError:
-                print(f"Soniox WebSocket timeout - no data received for 60s, session {session_id}")
-                break
             except WebSocketDisconnect:
-                print(f"Soniox WebSocket disconnected for session {session_id}")
+                logger.info("Soniox WebSocket disconnected for session %s", session_id)
                 break
             except Exception as loop_error:
-                print(f"Error in Soniox audio processing loop: {loop_error}")
-                traceback.print_exc()
+                logger.exception("Error in Soniox audio processing loop: %s", loop_error)
                 break
         
         # Cancel the results task
@@ -124,22 +177,25 @@ async def handle_soniox_streaming(websocket: WebSocket, current_user: Optional[o
                 pass
         
     except Exception as e:
-        print(f"Soniox WebSocket error: {e}")
-        traceback.print_exc()
+        logger.exception("Soniox WebSocket error: %s", e)
         try:
-            await websocket.send_json({"error": str(e)})
+            await send_json_fast(websocket, {"error": str(e)})
         except:
             pass
     finally:
+        # Stop the idle watchdog
+        if idle_task:
+            idle_task.cancel()
+        
         # Stop Soniox streaming session using correct method name
         if stt_session_id:
             try:
-                print(f"Stopping Soniox streaming session: {stt_session_id}")
+                logger.debug("Stopping Soniox streaming session: %s", stt_session_id)
                 await voice_service.stt_processor.stop_streaming_transcription(stt_session_id)
             except Exception as cleanup_error:
-                print(f"Error stopping Soniox streaming session: {cleanup_error}")
+                logger.error("Error stopping Soniox streaming session: %s", cleanup_error)
         
-        print(f"Cleaned up Soniox streaming session: {session_id}")
+        logger.info("Cleaned up Soniox streaming session: %s", session_id)
         
         try:
             await websocket.close()
@@ -1,60 +1,80 @@
 from fastapi import WebSocket, WebSocketDisconnect
+import asyncio
+import logging
 from app.core.config import settings
 from app.services.voice_service import voice_service
 from app.websockets.deepgram_handler import handle_deepgram_streaming
 from app.websockets.soniox_handler import handle_soniox_streaming
 from app.websockets.whisper_handler import handle_whisper_transcription
 from app.services.auth_service import auth_service
+from app.utils.json_utils import send_json_fast
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Caps concurrent STT sessions so a connection flood can't degrade active ones
+_stt_session_semaphore = asyncio.Semaphore(settings.max_concurrent_stt_sessions)
+
 async def handle_stt_websocket(websocket: WebSocket):
     """WebSocket endpoint that routes to provider-specific streaming handlers with fallback."""
     
+    # Reject before session validation or processor setup when the session pool is full
+    if _stt_session_semaphore.locked():
+        logger.warning("STT WebSocket - Session limit reached, rejecting connection")
+        await websocket.accept()
+        await send_json_fast(websocket, {"error": "Server busy, please try again shortly"})
+        await websocket.close(code=1013)
+        return
+    
     # Extract session token from query parameters
     session_token = websocket.query_params.get("session_token")
     current_user = None
     
-    print(f"STT WebSocket - Session token present: {session_token is not None}")
+    logger.debug("STT WebSocket - Session token present: %s", session_token is not None)
     if session_token:
-        print(f"STT WebSocket - Session token: {session_token[:10]}...")
-        current_user = await auth_service.validate_session(session_token)
+        logger.debug("STT WebSocket - Session token: %s...", session_token[:10])
+        current_user = await auth_service.validate_session_cached(session_token)
         if current_user:
-            print(f"STT WebSocket - Authenticated user: {current_user.email}")
+            logger.info("STT WebSocket - Authenticated user: %s", current_user.email)
         else:
-            print("STT WebSocket - Session token validation failed")
+            logger.info("STT WebSocket - Session token validation failed")
     else:
-        print("STT WebSocket - No session token provided")
+        logger.debug("STT WebSocket - No session token provided")
     
     # Ensure voice service is initialized before routing
-    print("Checking voice service initialization...")
+    logger.debug("Checking voice service initialization...")
     if not voice_service.stt_processor or not voice_service.tts_processor:
-        print("Voice service not initialized, initializing now...")
+        logger.info("Voice service not initialized, initializing now...")
         await voice_service.initialize_processors()
     
-    # Route to appropriate streaming handler based on configured provider
+    async with _stt_session_semaphore:
+        await _route_stt_websocket(websocket, current_user)
+
+async def _route_stt_websocket(websocket: WebSocket, current_user: Optional[object]):
+    """Route to appropriate streaming handler based on configured provider"""
     provider = settings.debabelizer_stt_provider.lower()
     
     if provider == "soniox":
-        print("Routing to Soniox streaming handler")
+        logger.debug("Routing to Soniox streaming handler")
         try:
             await handle_soniox_streaming(websocket, current_user)
         except Exception as soniox_error:
-            print(f"Soniox streaming failed: {soniox_error}")
-            print("Falling back to Deepgram streaming")
+            logger.error("Soniox streaming failed: %s", soniox_error)
+            logger.info("Falling back to Deepgram streaming")
             try:
                 # Close the websocket that failed and let frontend reconnect
-                await websocket.send_json({"error": "Soniox failed, please reconnect for Deepgram fallback"})
+                await send_json_fast(websocket, {"error": "Soniox failed, please reconnect for Deepgram fallback"})
                 await websocket.close()
             except:
                 pass
     elif provider == "deepgram":
-        print("Routing to Deepgram streaming handler")
+        logger.debug("Routing to Deepgram streaming handler")
         await handle_deepgram_streaming(websocket, current_user)
     elif provider == "openai_whisper":
-        print("Routing to OpenAI Whisper handler")
+        logger.debug("Routing to OpenAI Whisper handler")
         await handle_whisper_transcription(websocket, current_user)
     else:
         # Fallback to Deepgram approach for other providers
-        print(f"Unknown provider '{provider}', falling back to Deepgram streaming")
+        logger.warning("Unknown provider '%s', falling back to Deepgram streaming", provider)
         await handle_deepgram_streaming(websocket, current_user)
     
@@ -1,50 +1,104 @@
 from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.websockets import WebSocketState
 import asyncio
 import uuid
-import traceback
-import tempfile
-import os
+import logging
+import numpy as np
 from app.services.voice_service import voice_service
 from app.database.database import Database
 from app.utils.word_counter import count_words
+from app.utils.json_utils import send_json_fast
+from app.utils.audio_processing import pcm16_amplitude_stats, is_silent_pcm16
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+FLUSH_BUFFER_BYTES = 16000 * 2 * 4     # Process immediately after 4 seconds of audio
+MAX_FRAME_BYTES = 16000 * 2            # Largest accepted frame: 1 second at 16kHz 16-bit
+# The receive loop flushes as soon as FLUSH_BUFFER_BYTES is reached, so the
+# buffer never holds more than that plus one frame
+AUDIO_BUFFER_BYTES = FLUSH_BUFFER_BYTES + MAX_FRAME_BYTES
+WHISPER_COST_PER_SECOND = 0.0001       # OpenAI pricing
+
 async def handle_whisper_transcription(websocket: WebSocket, current_user: Optional[object] = None):
     """WebSocket handler for OpenAI Whisper using file-based transcription (non-streaming)."""
     await websocket.accept()
     session_id = str(uuid.uuid4())
     
-    # Buffer for collecting audio chunks
-    audio_buffer = bytearray()
-    buffer_timeout = None
+    # Fixed-capacity buffer for collecting audio chunks; buffered_bytes marks the filled prefix
+    audio_buffer = bytearray(AUDIO_BUFFER_BYTES)
+    buffered_bytes = 0
+    # Zero-copy int16 view over the buffer; valid because the buffer is never resized
+    audio_samples = np.frombuffer(audio_buffer, dtype=np.int16)
+    
+    # Debounce state: one long-lived task flushes the buffer after a quiet period
+    debounce_delay = 2.0  # seconds without new audio before processing
+    last_packet_time = 0.0
+    new_data_event = asyncio.Event()
+    process_lock = asyncio.Lock()
+    debounce_task = None
     
     try:
         if not voice_service.stt_processor:
-            print("ERROR: STT processor not initialized")
-            await websocket.send_json({"error": "STT processor not initialized"})
+            logger.error("STT processor not initialized")
+            await send_json_fast(websocket, {"error": "STT processor not initialized"})
             await websocket.close()
             return
         
-        print(f"Started Whisper STT session: {session_id}")
-        print(f"Processor type: {type(voice_service.stt_processor)}")
+        logger.info("Started Whisper STT session: %s", session_id)
+        logger.debug("Processor type: %s", type(voice_service.stt_processor))
+        
+        loop = asyncio.get_running_loop()
+        
+        # Reused for every result; send_json_fast serializes before yielding
+        response_data = {
+            "text": "",
+            "is_final": True,  # Whisper always returns final results
+            "language": "en",
+            "confidence": 0.0,
+            "provider": "openai_whisper",
+            "cost_estimate": 0.0
+        }
         
         async def process_buffered_audio():
-            """Process collected audio buffer"""
-            if len(audio_buffer) == 0:
+            """Process collected audio buffer; the single flush path for every trigger"""
+            # Serialize the debounce flush with immediate flushes from the receive loop
+            async with process_lock:
+                await _process_buffered_audio()
+        
+        async def _process_buffered_audio():
+            nonlocal buffered_bytes
+            if buffered_bytes == 0:
                 return
+            
+            samples = audio_samples[:buffered_bytes // 2]
+            if logger.isEnabledFor(logging.DEBUG):
+                peak, mean_amplitude, non_zero = pcm16_amplitude_stats(samples)
+                logger.debug("Whisper buffer stats: peak=%d mean=%.1f non_zero=%d", peak, mean_amplitude, non_zero)
+            
+            # Skip the Whisper call entirely for silent buffers
+            if is_silent_pcm16(samples):
+                logger.debug("Skipping silent Whisper buffer of %d bytes", buffered_bytes)
+                buffered_bytes = 0
+                return
+            
+            # Copy out the filled prefix and rewind before awaiting, so audio
+            # arriving during transcription lands in the reused buffer
+            pending_audio = bytes(memoryview(audio_buffer)[:buffered_bytes])
+            buffered_bytes = 0
                 
             try:
-                print(f"Processing {len(audio_buffer)} bytes of buffered audio with Whisper")
+                logger.debug("Processing %d bytes of buffered audio with Whisper", len(pending_audio))
                 
                 # Transcribe the buffered audio
                 result = await voice_service.stt_processor.transcribe_audio(
-                    audio_data=bytes(audio_buffer),
+                    audio_data=pending_audio,
                     audio_format="wav",  # PCM format from frontend
                     sample_rate=16000,   # 16kHz from frontend
                     language="en"        # Primary language
                 )
                 
-                print(f"Whisper transcription result: '{result.text}' (confidence: {result.confidence})")
+                logger.debug("Whisper transcription result: '%s' (confidence: %s)", result.text, result.confidence)
                 
                 # Track words for usage statistics
                 if result.text and current_user:
@@ -54,46 +108,41 @@ async def handle_whisper_transcription(websocket: WebSocket, current_user: Optio
                             user_id=current_user.id,
                             stt_words=word_count
                         )
-                        print(f"Tracked {word_count} STT words for user {current_user.email}")
-                
-                # Send result to frontend
-                response_data = {
-                    "text": result.text,
-                    "is_final": True,  # Whisper always returns final results
-                    "language": result.language_detected or "en",
-                    "confidence": result.confidence,
-                    "provider": "openai_whisper",
-                    "cost_estimate": result.metadata.get("api_usage_seconds", 0) * 0.0001  # OpenAI pricing
-                }
+                        logger.debug("Tracked %d STT words for user %s", word_count, current_user.email)
                 
                 # Only send non-empty results
                 if result.text.strip():
-                    print(f"Sending Whisper WebSocket response: {response_data}")
-                    await websocket.send_json(response_data)
-                    
-                # Clear buffer after processing
-                audio_buffer.clear()
+                    response_data["text"] = result.text
+                    response_data["language"] = result.language_detected or "en"
+                    response_data["confidence"] = result.confidence
+                    response_data["cost_estimate"] = result.metadata.get("api_usage_seconds", 0) * WHISPER_COST_PER_SECOND
+                    logger.debug("Sending Whisper WebSocket response: %s", response_data)
+                    await send_json_fast(websocket, response_data)
                 
             except Exception as e:
-                print(f"Error processing buffered audio with Whisper: {e}")
-                traceback.print_exc()
-                await websocket.send_json({"error": f"Transcription failed: {str(e)}"})
+                logger.exception("Error processing buffered audio with Whisper: %s", e)
+                await send_json_fast(websocket, {"error": f"Transcription failed: {str(e)}"})
         
-        async def schedule_buffer_processing():
-            """Schedule processing after a delay"""
-            nonlocal buffer_timeout
-            
-            # Cancel existing timeout
-            if buffer_timeout and not buffer_timeout.done():
-                buffer_timeout.cancel()
-            
-            # Schedule new processing
-            buffer_timeout = asyncio.create_task(asyncio.sleep(2.0))  # 2 second delay
-            try:
-                await buffer_timeout
-                await process_buffered_audio()
-            except asyncio.CancelledError:
-                pass  # Timeout was cancelled, new audio arrived
+        async def debounce_loop():
+            """Process the buffer once no new audio has arrived for debounce_delay"""
+            while True:
+                await new_data_event.wait()
+                new_data_event.clear()
+                
+                # Keep pushing the deadline out while packets keep arriving
+                remaining = last_packet_time + debounce_delay - loop.time()
+                while remaining > 0:
+                    await asyncio.sleep(remaining)
+                    remaining = last_packet_time + debounce_delay - loop.time()
+                
+                # A failed flush must not end the loop, or time-based flushes stop
+                try:
+                    await process_buffered_audio()
+                except Exception:
+                    logger.exception("Whisper debounce flush failed for session %s", session_id)
+        
+        debounce_task = asyncio.create_task(debounce_loop())
+        disconnected = False
         
         # Handle incoming audio data
         while True:
@@ -103,54 +152,62 @@ async def handle_whisper_transcription(websocket: WebSocket, current_user: Optio
                 
                 if len(data) == 0:
                     # Keepalive ping - process buffer if we have audio
-                    if len(audio_buffer) > 0:
-                        await process_buffered_audio()
+                    await process_buffered_audio()
                     continue
                 
-                print(f"Received {len(data)} bytes for Whisper buffering")
+                logger.debug("Received %d bytes for Whisper buffering", len(data))
                 
-                # Add to buffer
-                audio_buffer.extend(data)
+                # Add to buffer, dropping whatever an oversized frame doesn't fit
+                free_bytes = AUDIO_BUFFER_BYTES - buffered_bytes
+                if len(data) > free_bytes:
+                    logger.warning("Whisper buffer full, dropping %d bytes", len(data) - free_bytes)
+                    data = data[:free_bytes]
+                audio_buffer[buffered_bytes:buffered_bytes + len(data)] = data
+                buffered_bytes += len(data)
                 
-                # Schedule processing (will cancel previous if new audio arrives)
-                asyncio.create_task(schedule_buffer_processing())
+                # Push back the debounce deadline
+                last_packet_time = loop.time()
+                new_data_event.set()
                 
                 # Process immediately if buffer gets large (>4 seconds of audio)
-                max_buffer_size = 16000 * 2 * 4  # 4 seconds at 16kHz 16-bit
-                if len(audio_buffer) >= max_buffer_size:
-                    print("Buffer full, processing immediately")
+                if buffered_bytes >= FLUSH_BUFFER_BYTES:
+                    logger.debug("Buffer full, processing immediately")
                     await process_buffered_audio()
                 
             except asyncio.TimeoutError:
-                print(f"Whisper WebSocket timeout - no data received for 30s, session {session_id}")
-                # Process any remaining buffered audio before closing
-                if len(audio_buffer) > 0:
-                    await process_buffered_audio()
+                logger.info("Whisper WebSocket timeout - no data received for 30s, session %s", session_id)
                 break
             except WebSocketDisconnect:
-                print(f"Whisper WebSocket disconnected for session {session_id}")
-                # Process any remaining buffered audio before closing
-                if len(audio_buffer) > 0:
-                    await process_buffered_audio()
+                logger.info("Whisper WebSocket disconnected for session %s", session_id)
+                disconnected = True
                 break
             except Exception as loop_error:
-                print(f"Error in Whisper audio processing loop: {loop_error}")
-                traceback.print_exc()
+                logger.exception("Error in Whisper audio processing loop: %s", loop_error)
                 break
         
-        # Cancel any pending timeout
-        if buffer_timeout and not buffer_timeout.done():
-            buffer_timeout.cancel()
+        # Process any remaining buffered audio before closing, unless the client
+        # is gone and the result could never be delivered
+        if not disconnected and websocket.client_state == WebSocketState.CONNECTED:
+            await process_buffered_audio()
         
     except Exception as e:
-        print(f"Whisper WebSocket error: {e}")
-        traceback.print_exc()
+        logger.exception("Whisper WebSocket error: %s", e)
         try:
-            await websocket.send_json({"error": str(e)})
+            await send_json_fast(websocket, {"error": str(e)})
         except:
             pass
     finally:
-        print(f"Cleaned up Whisper session: {session_id}")
+        # Stop the debounce task and retrieve its exception if it already died
+        if debounce_task:
+            debounce_task.cancel()
+            try:
+                await debounce_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Whisper debounce task failed for session %s", session_id)
+        
+        logger.info("Cleaned up Whisper session: %s", session_id)
         
         try:
             await websocket.close()
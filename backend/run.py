@@ -5,19 +5,23 @@ Handles environment setup and starts the uvicorn server.
 """
 
 import os
+import re
 import sys
-import subprocess
 from pathlib import Path
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+OPENAI_KEY_PATTERN = re.compile(r'^\s*OPENAI_API_KEY\s*=')
+
 def check_requirements():
     """Check if required dependencies are installed."""
     try:
         import fastapi
         import uvicorn
+        import uvloop
+        import httptools
         import openai
         import pydantic_settings
         print("✓ All dependencies installed")
@@ -37,10 +41,9 @@ def check_env():
         print("  OPENAI_API_KEY=your-api-key-here")
         return False
     
-    # Check for OPENAI_API_KEY
+    # Check for an OPENAI_API_KEY assignment, ignoring comments that merely mention it
     with open(env_file) as f:
-        env_content = f.read()
-        if "OPENAI_API_KEY" not in env_content:
+        if not any(OPENAI_KEY_PATTERN.match(line) for line in f):
             print("✗ OPENAI_API_KEY not found in .env")
             return False
     
@@ -64,16 +67,28 @@ def main():
     print("\nStarting FastAPI server...")
     print(f"Server will run on: http://localhost:8005")
     print("API docs available at: http://localhost:8005/docs")
-    print("\nPress CTRL+C to stop\n")
+    print("\nPress CTRL+C to stop (pass --reload to restart on code changes)\n")
+    
+    import uvicorn
+    
+    # Serve from this interpreter by default; --reload opts into uvicorn's
+    # reloader, which runs the app in a separate worker process
+    reload = "--reload" in sys.argv[1:]
+    if reload:
+        print("Auto-reload enabled\n")
     
     try:
-        subprocess.run([
-            sys.executable, "-m", "uvicorn",
+        uvicorn.run(
             "app.main:app",
-            "--reload",
-            "--port", "8005",
-            "--host", "0.0.0.0"
-        ])
+            app_dir=str(backend_dir),
+            reload=reload,
+            port=8005,
+            host="0.0.0.0",
+            loop="uvloop",
+            http="httptools",
+            ws_ping_interval=20,
+            ws_ping_timeout=40
+        )
     except KeyboardInterrupt:
         print("\n\nServer stopped.")
 
@@ -13,6 +13,47 @@ from datetime import datetime, timedelta
 import os
 DB_PATH = os.path.join(os.path.dirname(__file__), 'backend', 'debabelizer_users.db')
 
+# Report queries, defined once at module level rather than inside each function
+USERS_SUMMARY_QUERY = """
+SELECT 
+    u.id as user_id,
+    u.email,
+    u.created_at as user_created,
+    COALESCE(SUM(us.stt_words), 0) as total_stt_words,
+    COALESCE(SUM(us.tts_words), 0) as total_tts_words,
+    COALESCE(SUM(us.stt_requests), 0) as total_stt_requests,
+    COALESCE(SUM(us.tts_requests), 0) as total_tts_requests,
+    COUNT(DISTINCT us.date) as active_days,
+    MIN(us.date) as first_usage,
+    MAX(us.date) as last_usage
+FROM users u
+LEFT JOIN user_usage_stats us ON u.id = us.user_id
+WHERE u.is_active = 1
+GROUP BY u.id, u.email
+ORDER BY u.created_at DESC
+"""
+
+RECENT_ACTIVITY_QUERY = """
+SELECT 
+    u.email,
+    SUM(us.stt_words) as stt_words,
+    SUM(us.tts_words) as tts_words,
+    SUM(us.stt_requests) as stt_requests,
+    SUM(us.tts_requests) as tts_requests,
+    MAX(us.date) as last_activity
+FROM user_usage_stats us
+JOIN users u ON u.id = us.user_id
+WHERE us.date >= ? AND u.is_active = 1
+GROUP BY u.id, u.email
+HAVING (stt_words > 0 OR tts_words > 0)
+ORDER BY (stt_words + tts_words) DESC
+"""
+
+def _write_lines(lines):
+    """Write a report section to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 def connect_db():
     """Connect to the database"""
     try:
@@ -27,40 +68,23 @@ def show_users_summary():
     """Show summary of all users"""
     conn = connect_db()
     cursor = conn.cursor()
+    lines = []
     
-    query = """
-    SELECT 
-        u.id as user_id,
-        u.email,
-        u.created_at as user_created,
-        COALESCE(SUM(us.stt_words), 0) as total_stt_words,
-        COALESCE(SUM(us.tts_words), 0) as total_tts_words,
-        COALESCE(SUM(us.stt_requests), 0) as total_stt_requests,
-        COALESCE(SUM(us.tts_requests), 0) as total_tts_requests,
-        COUNT(DISTINCT us.date) as active_days,
-        MIN(us.date) as first_usage,
-        MAX(us.date) as last_usage
-    FROM users u
-    LEFT JOIN user_usage_stats us ON u.id = us.user_id
-    WHERE u.is_active = 1
-    GROUP BY u.id, u.email
-    ORDER BY u.created_at DESC
-    """
-    
-    cursor.execute(query)
+    cursor.execute(USERS_SUMMARY_QUERY)
     rows = cursor.fetchall()
     
-    print("=" * 100)
-    print("USER USAGE SUMMARY")
-    print("=" * 100)
+    lines.append("=" * 100)
+    lines.append("USER USAGE SUMMARY")
+    lines.append("=" * 100)
     
     if not rows:
-        print("No users found.")
+        lines.append("No users found.")
+        _write_lines(lines)
         conn.close()
         return
     
-    print(f"{'Email':<35} {'STT Words':<10} {'TTS Words':<10} {'STT Reqs':<8} {'TTS Reqs':<8} {'Days':<5} {'First Use':<12} {'Last Use':<12}")
-    print("-" * 100)
+    lines.append(f"{'Email':<35} {'STT Words':<10} {'TTS Words':<10} {'STT Reqs':<8} {'TTS Reqs':<8} {'Days':<5} {'First Use':<12} {'Last Use':<12}")
+    lines.append("-" * 100)
     
     total_stt_words = 0
     total_tts_words = 0
@@ -77,41 +101,44 @@ def show_users_summary():
         first_use = row['first_usage'][:10] if row['first_usage'] else 'Never'
         last_use = row['last_usage'][:10] if row['last_usage'] else 'Never'
         
-        print(f"{email:<35} {stt_words:<10} {tts_words:<10} {stt_reqs:<8} {tts_reqs:<8} {active_days:<5} {first_use:<12} {last_use:<12}")
+        lines.append(f"{email:<35} {stt_words:<10} {tts_words:<10} {stt_reqs:<8} {tts_reqs:<8} {active_days:<5} {first_use:<12} {last_use:<12}")
         
         total_stt_words += stt_words
         total_tts_words += tts_words
         total_stt_requests += stt_reqs
         total_tts_requests += tts_reqs
     
-    print("-" * 100)
-    print(f"{'TOTALS':<35} {total_stt_words:<10} {total_tts_words:<10} {total_stt_requests:<8} {total_tts_requests:<8}")
-    print()
+    lines.append("-" * 100)
+    lines.append(f"{'TOTALS':<35} {total_stt_words:<10} {total_tts_words:<10} {total_stt_requests:<8} {total_tts_requests:<8}")
+    lines.append("")
     
+    _write_lines(lines)
     conn.close()
 
 def show_user_details(email):
     """Show detailed stats for a specific user"""
     conn = connect_db()
     cursor = conn.cursor()
+    lines = []
     
     # Get user info
     cursor.execute("SELECT * FROM users WHERE email = ? AND is_active = 1", (email.lower(),))
     user = cursor.fetchone()
     
     if not user:
-        print(f"User '{email}' not found.")
+        lines.append(f"User '{email}' not found.")
+        _write_lines(lines)
         conn.close()
         return
     
-    print("=" * 80)
-    print(f"DETAILED USAGE FOR USER: {user['email']}")
-    print("=" * 80)
-    print(f"User ID: {user['id']}")
-    print(f"Account Created: {user['created_at']}")
-    print(f"Email Confirmed: {'Yes' if user['is_confirmed'] else 'No'}")
-    print(f"Last Login: {user['last_login'] or 'Never'}")
-    print()
+    lines.append("=" * 80)
+    lines.append(f"DETAILED USAGE FOR USER: {user['email']}")
+    lines.append("=" * 80)
+    lines.append(f"User ID: {user['id']}")
+    lines.append(f"Account Created: {user['created_at']}")
+    lines.append(f"Email Confirmed: {'Yes' if user['is_confirmed'] else 'No'}")
+    lines.append(f"Last Login: {user['last_login'] or 'Never'}")
+    lines.append("")
     
     # Get usage stats
     cursor.execute("""
@@ -124,10 +151,10 @@ def show_user_details(email):
     stats = cursor.fetchall()
     
     if stats:
-        print("DAILY USAGE (Last 30 entries):")
-        print("-" * 80)
-        print(f"{'Date':<12} {'STT Words':<10} {'TTS Words':<10} {'STT Reqs':<8} {'TTS Reqs':<8} {'Updated':<20}")
-        print("-" * 80)
+        lines.append("DAILY USAGE (Last 30 entries):")
+        lines.append("-" * 80)
+        lines.append(f"{'Date':<12} {'STT Words':<10} {'TTS Words':<10} {'STT Reqs':<8} {'TTS Reqs':<8} {'Updated':<20}")
+        lines.append("-" * 80)
         
         total_stt = 0
         total_tts = 0
@@ -137,53 +164,40 @@ def show_user_details(email):
             total_tts += stat['tts_words']
             updated = stat['updated_at'][:19] if stat['updated_at'] else ''
             
-            print(f"{stat['date']:<12} {stat['stt_words']:<10} {stat['tts_words']:<10} {stat['stt_requests']:<8} {stat['tts_requests']:<8} {updated:<20}")
+            lines.append(f"{stat['date']:<12} {stat['stt_words']:<10} {stat['tts_words']:<10} {stat['stt_requests']:<8} {stat['tts_requests']:<8} {updated:<20}")
         
-        print("-" * 80)
-        print(f"{'TOTALS':<12} {total_stt:<10} {total_tts:<10}")
+        lines.append("-" * 80)
+        lines.append(f"{'TOTALS':<12} {total_stt:<10} {total_tts:<10}")
     else:
-        print("No usage data found for this user.")
+        lines.append("No usage data found for this user.")
     
-    print()
+    lines.append("")
+    _write_lines(lines)
     conn.close()
 
 def show_recent_activity(days=7):
     """Show recent activity"""
     conn = connect_db()
     cursor = conn.cursor()
+    lines = []
     
     start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
     
-    query = """
-    SELECT 
-        u.email,
-        SUM(us.stt_words) as stt_words,
-        SUM(us.tts_words) as tts_words,
-        SUM(us.stt_requests) as stt_requests,
-        SUM(us.tts_requests) as tts_requests,
-        MAX(us.date) as last_activity
-    FROM users u
-    JOIN user_usage_stats us ON u.id = us.user_id
-    WHERE us.date >= ? AND u.is_active = 1
-    GROUP BY u.id, u.email
-    HAVING (stt_words > 0 OR tts_words > 0)
-    ORDER BY (stt_words + tts_words) DESC
-    """
-    
-    cursor.execute(query, (start_date,))
+    cursor.execute(RECENT_ACTIVITY_QUERY, (start_date,))
     rows = cursor.fetchall()
     
-    print("=" * 80)
-    print(f"RECENT ACTIVITY (Last {days} days)")
-    print("=" * 80)
+    lines.append("=" * 80)
+    lines.append(f"RECENT ACTIVITY (Last {days} days)")
+    lines.append("=" * 80)
     
     if not rows:
-        print(f"No activity found in the last {days} days.")
+        lines.append(f"No activity found in the last {days} days.")
+        _write_lines(lines)
         conn.close()
         return
     
-    print(f"{'Email':<35} {'STT Words':<10} {'TTS Words':<10} {'Total':<10} {'Last Activity':<12}")
-    print("-" * 80)
+    lines.append(f"{'Email':<35} {'STT Words':<10} {'TTS Words':<10} {'Total':<10} {'Last Activity':<12}")
+    lines.append("-" * 80)
     
     for row in rows:
         email = row['email'][:33] + '..' if len(row['email']) > 35 else row['email']
@@ -192,9 +206,10 @@ def show_recent_activity(days=7):
         total_words = stt_words + tts_words
         last_activity = row['last_activity']
         
-        print(f"{email:<35} {stt_words:<10} {tts_words:<10} {total_words:<10} {last_activity:<12}")
+        lines.append(f"{email:<35} {stt_words:<10} {tts_words:<10} {total_words:<10} {last_activity:<12}")
     
-    print()
+    lines.append("")
+    _write_lines(lines)
     conn.close()
 
 def show_db_info():
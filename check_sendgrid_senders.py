@@ -2,7 +2,6 @@
 """Check verified senders in SendGrid"""
 
 import os
-import sys
 import requests
 from dotenv import load_dotenv
 
@@ -20,8 +19,13 @@ if api_key:
     
     print("Checking SendGrid verified senders...\n")
     
+    # Both lookups share one session so the second reuses the first's connection
+    with requests.Session() as session:
+        session.headers.update(headers)
+        senders_response = session.get('https://api.sendgrid.com/v3/verified_senders')
+        domains_response = session.get('https://api.sendgrid.com/v3/whitelabel/domains')
+    
     # Check verified senders
-    senders_response = requests.get('https://api.sendgrid.com/v3/verified_senders', headers=headers)
     if senders_response.status_code == 200:
         senders = senders_response.json()
         print("Verified Senders:")
@@ -37,7 +41,6 @@ if api_key:
     
     # Check domain authentication
     print("\nChecking authenticated domains...")
-    domains_response = requests.get('https://api.sendgrid.com/v3/whitelabel/domains', headers=headers)
     if domains_response.status_code == 200:
         domains = domains_response.json()
         if domains:
@@ -4,12 +4,13 @@ Create multi-language test audio files for Soniox language auto-detection testin
 """
 
 import asyncio
-import os
 import sys
 from pathlib import Path
 
 # Add the debabelizer module to the path
-sys.path.append(str(Path("~/debabelizer").expanduser()))
+debabelizer_path = str(Path("~/debabelizer").expanduser())
+if debabelizer_path not in sys.path:
+    sys.path.append(debabelizer_path)
 
 from debabelizer import VoiceProcessor
 
@@ -39,24 +40,28 @@ async def create_multilang_audio_files():
     
     print("Creating multi-language test audio files...")
     
-    for language, phrase in TEST_PHRASES.items():
+    # Limit concurrent TTS calls to stay within provider rate limits
+    semaphore = asyncio.Semaphore(3)
+    
+    async def create_language_file(language, phrase):
         try:
-            print(f"Generating {language} audio: '{phrase[:50]}...'")
-            
-            # Generate TTS audio
-            result = await voice_processor.synthesize(phrase)
-            audio_data = result.audio_data
+            async with semaphore:
+                print(f"Generating {language} audio: '{phrase[:50]}...'")
+                
+                # Generate TTS audio
+                result = await voice_processor.synthesize(phrase)
             
-            # Save to file
+            # Save to file without blocking the other syntheses
             output_file = output_dir / f"test_{language}.mp3"
-            with open(output_file, "wb") as f:
-                f.write(audio_data)
+            await asyncio.to_thread(output_file.write_bytes, result.audio_data)
             
             print(f"✅ Created: {output_file}")
             
         except Exception as e:
             print(f"❌ Error creating {language} audio: {e}")
     
+    await asyncio.gather(*(create_language_file(language, phrase) for language, phrase in TEST_PHRASES.items()))
+    
     print(f"\nAll audio files created in: {output_dir.absolute()}")
     return output_dir
 
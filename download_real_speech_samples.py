@@ -5,7 +5,6 @@ Download real human speech samples from Omniglot for testing Soniox language aut
 
 import asyncio
 import aiohttp
-import os
 from pathlib import Path
 
 # URLs for real human speech samples from Omniglot
@@ -32,6 +31,8 @@ SPEECH_SAMPLES = {
     }
 }
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 async def download_speech_sample(session, language, config, output_dir):
     """Download a single speech sample"""
     try:
@@ -40,18 +41,23 @@ async def download_speech_sample(session, language, config, output_dir):
         
         async with session.get(config['url']) as response:
             if response.status == 200:
-                audio_data = await response.read()
+                if response.content_length:
+                    print(f"   Expecting {response.content_length:,} bytes")
                 
-                # Save to file
+                # Stream to file in fixed-size chunks instead of holding the whole MP3 in memory
                 output_file = output_dir / f"real_speech_{language}.mp3"
+                size = 0
                 with open(output_file, "wb") as f:
-                    f.write(audio_data)
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        # Write off the event loop so sibling downloads keep flowing
+                        await asyncio.to_thread(f.write, chunk)
+                        size += len(chunk)
                 
-                print(f"✅ Downloaded: {output_file} ({len(audio_data):,} bytes)")
+                print(f"✅ Downloaded: {output_file} ({size:,} bytes)")
                 return {
                     "language": language,
                     "file": output_file,
-                    "size": len(audio_data),
+                    "size": size,
                     "expected_language": config['expected_language'],
                     "description": config['description']
                 }
@@ -59,6 +65,9 @@ async def download_speech_sample(session, language, config, output_dir):
                 print(f"❌ Failed to download {language}: HTTP {response.status}")
                 return None
                 
+    except aiohttp.ClientConnectorError:
+        # Host unreachable (DNS/TLS/connect) fails every sibling too; let the task group cancel them
+        raise
     except Exception as e:
         print(f"❌ Error downloading {language}: {e}")
         return None
@@ -75,17 +84,27 @@ async def download_all_samples():
     
     downloaded_samples = []
     
-    async with aiohttp.ClientSession() as session:
-        # Download all samples concurrently
-        tasks = []
-        for language, config in SPEECH_SAMPLES.items():
-            task = download_speech_sample(session, language, config, output_dir)
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks)
-        
-        # Filter successful downloads
-        downloaded_samples = [result for result in results if result is not None]
+    # Bounded, keep-alive connection pool so downloads from the same host reuse connections
+    connector = aiohttp.TCPConnector(limit=8, limit_per_host=4, keepalive_timeout=30, enable_cleanup_closed=True)
+    timeout = aiohttp.ClientTimeout(total=60)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        try:
+            # Download all samples concurrently; a connection failure cancels the rest
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(download_speech_sample(session, language, config, output_dir))
+                    for language, config in SPEECH_SAMPLES.items()
+                ]
+                
+                # Collect results as each download finishes rather than waiting for the slowest
+                for next_result in asyncio.as_completed(tasks):
+                    result = await next_result
+                    if result is not None:
+                        downloaded_samples.append(result)
+        except* aiohttp.ClientConnectorError as error_group:
+            for error in error_group.exceptions:
+                print(f"❌ Cannot reach sample host, remaining downloads cancelled: {error}")
     
     # Summary
     print(f"\n📊 Download Summary:")
@@ -4,16 +4,21 @@ Generate real TTS audio samples in multiple languages for Soniox STT testing
 """
 
 import asyncio
+import hashlib
 import os
+import shutil
 import sys
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
-load_dotenv("backend/.env")
+load_dotenv(Path(__file__).parent / "backend" / ".env")
 
 # Add the debabelizer module to the path
-sys.path.append(str(Path("~/debabelizer").expanduser()))
+debabelizer_path = str(Path("~/debabelizer").expanduser())
+if debabelizer_path not in sys.path:
+    sys.path.append(debabelizer_path)
 
 from debabelizer import VoiceProcessor
 
@@ -37,6 +42,28 @@ TEST_PHRASES = {
     }
 }
 
+# Synthesized audio is cached by (TTS settings, text, language) so reruns skip the paid TTS call
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def tts_settings_key():
+    """Return the environment settings that pick VoiceProcessor's TTS provider and voice"""
+    return "|".join(
+        f"{name}={value}" for name, value in sorted(os.environ.items())
+        if name.startswith("DEBABELIZER_TTS") or "VOICE" in name
+    )
+
+def cached_audio_path(cache_dir, settings_key, text, language):
+    """Return the cache file for a phrase, keyed by a hash of the TTS settings, text and language"""
+    key = hashlib.sha256(f"{settings_key}|{language}|{text}".encode()).hexdigest()
+    return cache_dir / f"{key}.mp3"
+
+def is_cache_fresh(cache_file):
+    """Check whether a cached file exists and is younger than the TTL"""
+    try:
+        return time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS
+    except FileNotFoundError:
+        return False
+
 async def generate_multilingual_audio():
     """Generate TTS audio files in multiple languages"""
     
@@ -49,11 +76,31 @@ async def generate_multilingual_audio():
     # Create output directory
     output_dir = Path("multilingual_speech_samples")
     output_dir.mkdir(exist_ok=True)
+    cache_dir = output_dir / ".tts_cache"
+    cache_dir.mkdir(exist_ok=True)
+    settings_key = tts_settings_key()
     
     generated_files = {}
     
-    for language_name, config in TEST_PHRASES.items():
-        try:
+    # Run the syntheses concurrently, capped to avoid overrunning the TTS provider
+    semaphore = asyncio.Semaphore(4)
+    
+    async def generate_language_audio(language_name, config):
+        output_file = output_dir / f"speech_{language_name}.mp3"
+        cache_file = cached_audio_path(cache_dir, settings_key, config['text'], config['language'])
+        
+        if is_cache_fresh(cache_file):
+            await asyncio.to_thread(shutil.copyfile, cache_file, output_file)
+            size_bytes = cache_file.stat().st_size
+            print(f"♻️  Reused cached {language_name.title()} audio: {output_file} ({size_bytes:,} bytes)")
+            return {
+                "file": output_file,
+                "text": config['text'],
+                "language": config['language'],
+                "size_bytes": size_bytes
+            }
+        
+        async with semaphore:
             print(f"\n🗣️  Generating {language_name.title()} speech...")
             print(f"Text: {config['text'][:60]}...")
             
@@ -62,25 +109,32 @@ async def generate_multilingual_audio():
                 text=config['text'],
                 language=config['language']
             )
-            
-            # Save to file
-            output_file = output_dir / f"speech_{language_name}.mp3"
-            with open(output_file, "wb") as f:
-                f.write(result.audio_data)
-            
-            generated_files[language_name] = {
-                "file": output_file,
-                "text": config['text'],
-                "language": config['language'],
-                "size_bytes": len(result.audio_data)
-            }
-            
-            print(f"✅ Generated: {output_file} ({len(result.audio_data):,} bytes)")
-            
-        except Exception as e:
-            print(f"❌ Error generating {language_name} audio: {e}")
+        
+        # Save to file and cache without blocking the other syntheses
+        await asyncio.to_thread(output_file.write_bytes, result.audio_data)
+        await asyncio.to_thread(cache_file.write_bytes, result.audio_data)
+        
+        print(f"✅ Generated: {output_file} ({len(result.audio_data):,} bytes)")
+        
+        return {
+            "file": output_file,
+            "text": config['text'],
+            "language": config['language'],
+            "size_bytes": len(result.audio_data)
+        }
+    
+    results = await asyncio.gather(
+        *(generate_language_audio(language_name, config) for language_name, config in TEST_PHRASES.items()),
+        return_exceptions=True
+    )
+    
+    for language_name, result in zip(TEST_PHRASES, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error generating {language_name} audio: {result}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(result), result, result.__traceback__)
+        else:
+            generated_files[language_name] = result
     
     # Summary
     print(f"\n📊 Generation Complete!")
@@ -9,7 +9,6 @@ import asyncio
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import Optional
 
 # Add the backend path to sys.path to import database module
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
@@ -20,26 +19,32 @@ os.chdir(backend_path)
 
 from app.database.database import Database
 
+# Row layouts are built once and reused for every table line
+SUMMARY_ROW = "{:<30} {:<12} {:<12} {:<10} {:<10} {:<6} {:<12} {:<12}".format
+DAILY_ROW = "{:<12} {:<12} {:<12} {:<10} {:<10}".format
+RECENT_ROW = "{:<30} {:<12} {:<12} {:<12}".format
+
+def write_lines(lines):
+    """Write a report section to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 async def display_all_users_summary():
     """Display usage summary for all users"""
-    print("=" * 80)
-    print("USER USAGE SUMMARY")
-    print("=" * 80)
+    lines = ["=" * 80, "USER USAGE SUMMARY", "=" * 80]
     
-    users = await Database.get_all_users_usage_summary()
+    users, totals = await asyncio.gather(
+        Database.get_all_users_usage_summary(),
+        Database.get_global_usage_totals()
+    )
     
     if not users:
-        print("No users found in the database.")
+        lines.append("No users found in the database.")
+        write_lines(lines)
         return
     
     # Header
-    print(f"{'Email':<30} {'STT Words':<12} {'TTS Words':<12} {'STT Reqs':<10} {'TTS Reqs':<10} {'Days':<6} {'First Use':<12} {'Last Use':<12}")
-    print("-" * 80)
-    
-    total_stt_words = 0
-    total_tts_words = 0
-    total_stt_requests = 0
-    total_tts_requests = 0
+    lines.append(SUMMARY_ROW('Email', 'STT Words', 'TTS Words', 'STT Reqs', 'TTS Reqs', 'Days', 'First Use', 'Last Use'))
+    lines.append("-" * 80)
     
     for user in users:
         email = user['email'][:28] + '..' if len(user['email']) > 30 else user['email']
@@ -51,38 +56,34 @@ async def display_all_users_summary():
         first_use = user['first_usage'][:10] if user['first_usage'] else 'Never'
         last_use = user['last_usage'][:10] if user['last_usage'] else 'Never'
         
-        print(f"{email:<30} {stt_words:<12} {tts_words:<12} {stt_reqs:<10} {tts_reqs:<10} {active_days:<6} {first_use:<12} {last_use:<12}")
-        
-        total_stt_words += stt_words
-        total_tts_words += tts_words
-        total_stt_requests += stt_reqs
-        total_tts_requests += tts_reqs
-    
-    print("-" * 80)
-    print(f"{'TOTALS':<30} {total_stt_words:<12} {total_tts_words:<12} {total_stt_requests:<10} {total_tts_requests:<10}")
-    print()
+        lines.append(SUMMARY_ROW(email, stt_words, tts_words, stt_reqs, tts_reqs, active_days, first_use, last_use))
+    
+    lines.append("-" * 80)
+    lines.append(f"{'TOTALS':<30} {totals['total_stt_words']:<12} {totals['total_tts_words']:<12} {totals['total_stt_requests']:<10} {totals['total_tts_requests']:<10}")
+    lines.append("")
+    write_lines(lines)
 
 async def display_user_details(email: str, days: int = 30):
     """Display detailed usage for a specific user"""
-    # First get the user by email
-    users = await Database.get_all_users_usage_summary()
-    user = next((u for u in users if u['email'].lower() == email.lower()), None)
+    user = await Database.get_user_usage_summary_by_email(email)
     
     if not user:
         print(f"User '{email}' not found.")
         return
     
-    print("=" * 80)
-    print(f"DETAILED USAGE FOR USER: {user['email']}")
-    print("=" * 80)
-    print(f"User ID: {user['user_id']}")
-    print(f"Account Created: {user['user_created']}")
-    print(f"Total STT Words: {user['total_stt_words'] or 0}")
-    print(f"Total TTS Words: {user['total_tts_words'] or 0}")
-    print(f"Total STT Requests: {user['total_stt_requests'] or 0}")
-    print(f"Total TTS Requests: {user['total_tts_requests'] or 0}")
-    print(f"Active Days: {user['active_days'] or 0}")
-    print()
+    lines = [
+        "=" * 80,
+        f"DETAILED USAGE FOR USER: {user['email']}",
+        "=" * 80,
+        f"User ID: {user['user_id']}",
+        f"Account Created: {user['user_created']}",
+        f"Total STT Words: {user['total_stt_words'] or 0}",
+        f"Total TTS Words: {user['total_tts_words'] or 0}",
+        f"Total STT Requests: {user['total_stt_requests'] or 0}",
+        f"Total TTS Requests: {user['total_tts_requests'] or 0}",
+        f"Active Days: {user['active_days'] or 0}",
+        "",
+    ]
     
     # Get daily breakdown
     start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -92,69 +93,50 @@ async def display_user_details(email: str, days: int = 30):
     )
     
     if daily_stats:
-        print(f"DAILY BREAKDOWN (Last {days} days):")
-        print("-" * 80)
-        print(f"{'Date':<12} {'STT Words':<12} {'TTS Words':<12} {'STT Reqs':<10} {'TTS Reqs':<10}")
-        print("-" * 80)
+        lines.append(f"DAILY BREAKDOWN (Last {days} days):")
+        lines.append("-" * 80)
+        lines.append(DAILY_ROW('Date', 'STT Words', 'TTS Words', 'STT Reqs', 'TTS Reqs'))
+        lines.append("-" * 80)
         
-        for day in daily_stats:
-            print(f"{day['date']:<12} {day['stt_words']:<12} {day['tts_words']:<12} {day['stt_requests']:<10} {day['tts_requests']:<10}")
+        lines.extend(
+            DAILY_ROW(day['date'], day['stt_words'], day['tts_words'], day['stt_requests'], day['tts_requests'])
+            for day in daily_stats
+        )
     else:
-        print(f"No usage data found for the last {days} days.")
+        lines.append(f"No usage data found for the last {days} days.")
     
-    print()
+    lines.append("")
+    write_lines(lines)
 
 async def display_recent_activity(days: int = 7):
     """Display recent activity across all users"""
-    print("=" * 80)
-    print(f"RECENT ACTIVITY (Last {days} days)")
-    print("=" * 80)
+    lines = ["=" * 80, f"RECENT ACTIVITY (Last {days} days)", "=" * 80]
     
-    # Get all users and their recent stats
-    users = await Database.get_all_users_usage_summary()
+    # Aggregate every user's recent stats in a single query
     start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    
-    recent_activity = []
-    
-    for user in users:
-        daily_stats = await Database.get_usage_stats(
-            user_id=user['user_id'],
-            start_date=start_date
-        )
-        
-        if daily_stats:
-            total_stt = sum(day['stt_words'] for day in daily_stats)
-            total_tts = sum(day['tts_words'] for day in daily_stats)
-            
-            if total_stt > 0 or total_tts > 0:
-                recent_activity.append({
-                    'email': user['email'],
-                    'stt_words': total_stt,
-                    'tts_words': total_tts,
-                    'total_words': total_stt + total_tts
-                })
+    recent_activity = await Database.get_recent_activity_for_all_users(start_date)
     
     if not recent_activity:
-        print(f"No activity found in the last {days} days.")
+        lines.append(f"No activity found in the last {days} days.")
+        write_lines(lines)
         return
     
-    # Sort by total activity
-    recent_activity.sort(key=lambda x: x['total_words'], reverse=True)
-    
-    print(f"{'Email':<30} {'STT Words':<12} {'TTS Words':<12} {'Total Words':<12}")
-    print("-" * 80)
+    lines.append(RECENT_ROW('Email', 'STT Words', 'TTS Words', 'Total Words'))
+    lines.append("-" * 80)
     
     for activity in recent_activity:
         email = activity['email'][:28] + '..' if len(activity['email']) > 30 else activity['email']
-        print(f"{email:<30} {activity['stt_words']:<12} {activity['tts_words']:<12} {activity['total_words']:<12}")
+        lines.append(RECENT_ROW(email, activity['stt_words'], activity['tts_words'], activity['total_words']))
     
-    print()
+    lines.append("")
+    write_lines(lines)
 
 async def main():
     """Main function to handle command line arguments and display stats"""
     
-    # Initialize database
-    await Database.initialize()
+    # Initialize database unless we are only printing help
+    if not (len(sys.argv) == 2 and sys.argv[1] in ['-h', '--help']):
+        await Database.initialize()
     
     if len(sys.argv) == 1:
         # No arguments - show summary and recent activity
@@ -4,8 +4,6 @@ Simple direct test of Deepgram WebSocket streaming
 """
 
 import asyncio
-import json
-import struct
 import numpy as np
 from deepgram import DeepgramClient, LiveOptions, LiveTranscriptionEvents
 
@@ -19,11 +17,14 @@ def generate_test_audio():
     duration = 0.032  # 32ms
     frequency = 440
     
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = 0.3 * np.sin(2 * np.pi * frequency * t)
-    pcm = (wave * 32767).astype(np.int16)
+    # Build the wave in float32 and scale it in place to avoid float64 temporaries
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) / np.float32(sample_rate)
+    wave = np.sin(t * np.float32(2 * np.pi * frequency), out=t)
+    wave *= np.float32(0.3 * 32767)
+    pcm = wave.astype(np.int16)
     
-    return struct.pack(f'{len(pcm)}h', *pcm)
+    # Little-endian int16 as Deepgram's linear16 expects, copied out in one memcpy
+    return pcm.astype('<i2', copy=False).tobytes()
 
 async def test_direct_deepgram():
     """Test Deepgram streaming directly"""
@@ -94,9 +95,12 @@ async def test_direct_deepgram():
                 test_audio = generate_test_audio()
                 print(f"Sending {len(test_audio)} bytes of test audio...")
                 
+                # Pace sends against fixed deadlines so send latency does not accumulate as drift
+                loop = asyncio.get_running_loop()
+                start_time = loop.time()
                 for i in range(10):  # Send 10 chunks
+                    await asyncio.sleep(max(0.0, start_time + i * 0.1 - loop.time()))
                     dg_connection.send(test_audio)
-                    await asyncio.sleep(0.1)
                 
                 # Wait for results
                 print("Waiting for transcription results...")